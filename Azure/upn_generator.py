@@ -5,19 +5,32 @@ Generates all possible User Principal Name (UPN) combinations from a domain and
 """
 
 import argparse
+import re
 import sys
-from itertools import combinations
+from functools import lru_cache
+from itertools import combinations, permutations
 
+# Separators tried between name components
+SEPS = ('', '.', '_', '-')
 
+# Matches runs of anything that is not a letter or whitespace
+_CLEAN_RE = re.compile(r'[^A-Za-z\s]+')
+
+
+@lru_cache(maxsize=4096)
 def clean_name_part(name_part):
     """Clean and normalize a name part by removing special characters and converting to lowercase."""
-    # Remove common special characters and normalize
-    cleaned = ''.join(c for c in name_part if c.isalpha() or c.isspace())
-    return cleaned.strip().lower()
+    # Remove common special characters and normalize in one regex pass
+    return _CLEAN_RE.sub('', name_part).strip().lower()
 
 
+@lru_cache(maxsize=4096)
 def parse_full_name(full_name):
-    """Parse full name into components (first, middle, last names)."""
+    """Parse full name into components (first, middle, last names).
+
+    Middle names come back as a tuple so the result is hashable and
+    cacheable.
+    """
     # Split by spaces and filter out empty strings
     name_parts = [part.strip() for part in full_name.split() if part.strip()]
     
@@ -32,123 +45,149 @@ def parse_full_name(full_name):
     
     first_name = cleaned_parts[0]
     last_name = cleaned_parts[-1] if len(cleaned_parts) > 1 else ""
-    middle_names = cleaned_parts[1:-1] if len(cleaned_parts) > 2 else []
-    
+    middle_names = tuple(cleaned_parts[1:-1]) if len(cleaned_parts) > 2 else ()
+
     return first_name, middle_names, last_name
 
 
-def generate_upn_combinations(first_name, middle_names, last_name, domain):
-    """Generate all possible UPN combinations."""
-    upns = set()  # Use set to avoid duplicates
-    
-    # All name components
-    all_names = [first_name] + middle_names + ([last_name] if last_name else [])
-    
+def _two_name_bases(first_name, last_name):
+    """Unrolled pattern list for the dominant "First Last" input shape.
+
+    Mirrors what _enumerate_bases produces for exactly two components, with
+    every loop flattened into literal f-strings. Duplicates are fine; the
+    caller dedups.
+    """
+    fi = first_name[0]
+    li = last_name[0]
+    return [
+        # Single names
+        first_name,
+        last_name,
+        # Both orders, every separator
+        f"{first_name}{last_name}", f"{first_name}.{last_name}",
+        f"{first_name}_{last_name}", f"{first_name}-{last_name}",
+        f"{last_name}{first_name}", f"{last_name}.{first_name}",
+        f"{last_name}_{first_name}", f"{last_name}-{first_name}",
+        # First initial + last name (and reverse)
+        f"{fi}{last_name}", f"{fi}.{last_name}",
+        f"{fi}_{last_name}", f"{fi}-{last_name}",
+        f"{last_name}{fi}", f"{last_name}.{fi}",
+        f"{last_name}_{fi}", f"{last_name}-{fi}",
+        # Last initial + first name (and reverse)
+        f"{li}{first_name}", f"{li}.{first_name}",
+        f"{li}_{first_name}", f"{li}-{first_name}",
+        f"{first_name}{li}", f"{first_name}.{li}",
+        f"{first_name}_{li}", f"{first_name}-{li}",
+        # Both initials
+        f"{fi}{li}",
+    ]
+
+
+def _enumerate_bases(first_name, middle_names, last_name):
+    """Enumerate domain-free base patterns for the given name components."""
+    # Fast path: "First Last" collapses to a fixed pattern list with no
+    # combinatorial loops
+    if not middle_names and last_name:
+        return _two_name_bases(first_name, last_name)
+
+    bases = []
+    append = bases.append  # bound method: skips the attribute lookup per call
+
+    # All name components (middle_names may be a list or tuple)
+    all_names = [first_name, *middle_names] + ([last_name] if last_name else [])
+
     # Single name patterns
     for name in all_names:
         if name:
-            upns.add(f"{name}@{domain}")
-    
-    # Two name combinations
+            append(name)
+
+    # Two name combinations (both orders, every separator)
     if len(all_names) >= 2:
-        for combo in combinations(all_names, 2):
-            name1, name2 = combo
-            # Various separators
-            upns.add(f"{name1}{name2}@{domain}")  # concatenated
-            upns.add(f"{name1}.{name2}@{domain}")  # dot separated
-            upns.add(f"{name1}_{name2}@{domain}")  # underscore separated
-            upns.add(f"{name1}-{name2}@{domain}")  # hyphen separated
-            
-            # Reverse order
-            upns.add(f"{name2}{name1}@{domain}")
-            upns.add(f"{name2}.{name1}@{domain}")
-            upns.add(f"{name2}_{name1}@{domain}")
-            upns.add(f"{name2}-{name1}@{domain}")
-    
+        for name1, name2 in permutations(all_names, 2):
+            for sep in SEPS:
+                append(f"{name1}{sep}{name2}")
+
     # Three name combinations (if available)
     if len(all_names) >= 3:
         for combo in combinations(all_names, 3):
             name1, name2, name3 = combo
-            # Various separators for three names
-            upns.add(f"{name1}{name2}{name3}@{domain}")
-            upns.add(f"{name1}.{name2}.{name3}@{domain}")
-            upns.add(f"{name1}_{name2}_{name3}@{domain}")
-            upns.add(f"{name1}-{name2}-{name3}@{domain}")
-            
+            for sep in SEPS:
+                append(sep.join(combo))
+
             # Mixed separators
-            upns.add(f"{name1}.{name2}{name3}@{domain}")
-            upns.add(f"{name1}{name2}.{name3}@{domain}")
-    
+            append(f"{name1}.{name2}{name3}")
+            append(f"{name1}{name2}.{name3}")
+
     # Initial + name combinations
     for i, name in enumerate(all_names):
         if name:
             initial = name[0]
-            
-            # Initial + other names
+
+            # Initial + other names (and reverse: name + initial)
             for j, other_name in enumerate(all_names):
                 if i != j and other_name:
-                    upns.add(f"{initial}{other_name}@{domain}")
-                    upns.add(f"{initial}.{other_name}@{domain}")
-                    upns.add(f"{initial}_{other_name}@{domain}")
-                    upns.add(f"{initial}-{other_name}@{domain}")
-                    
-                    # Reverse: name + initial
-                    upns.add(f"{other_name}{initial}@{domain}")
-                    upns.add(f"{other_name}.{initial}@{domain}")
-                    upns.add(f"{other_name}_{initial}@{domain}")
-                    upns.add(f"{other_name}-{initial}@{domain}")
-    
-    # Multiple initials + name combinations  
-    if len(all_names) >= 2:
-        for main_name in all_names:
-            if main_name:
-                # Get initials of other names
-                other_names = [n for n in all_names if n != main_name]
-                if other_names:
-                    initials = ''.join([n[0] for n in other_names])
-                    upns.add(f"{initials}{main_name}@{domain}")
-                    upns.add(f"{initials}.{main_name}@{domain}")
-                    upns.add(f"{initials}_{main_name}@{domain}")
-                    upns.add(f"{initials}-{main_name}@{domain}")
-                    
-                    # Reverse
-                    upns.add(f"{main_name}{initials}@{domain}")
-                    upns.add(f"{main_name}.{initials}@{domain}")
-                    upns.add(f"{main_name}_{initials}@{domain}")
-                    upns.add(f"{main_name}-{initials}@{domain}")
-    
-    # All initials combination
+                    for sep in SEPS:
+                        append(f"{initial}{sep}{other_name}")
+                        append(f"{other_name}{sep}{initial}")
+
+    # Multiple initials + name combinations
     if len(all_names) >= 2:
+        # Build the full initials string once; the "other initials" for each
+        # name are then O(n) slices of it. Slicing by position also handles
+        # duplicate names correctly, unlike filtering on equality.
         all_initials = ''.join([name[0] for name in all_names if name])
+        for i, main_name in enumerate(all_names):
+            if main_name:
+                initials = all_initials[:i] + all_initials[i + 1:]
+                if initials:
+                    for sep in SEPS:
+                        append(f"{initials}{sep}{main_name}")
+                        # Reverse
+                        append(f"{main_name}{sep}{initials}")
+
+        # All initials combination
         if len(all_initials) >= 2:
-            upns.add(f"{all_initials}@{domain}")
-    
-    # Common variations with numbers (often used in organizations)
-    base_combinations = []
-    
-    # Collect base patterns without domain
-    for upn in list(upns):
-        base = upn.split('@')[0]
-        base_combinations.append(base)
-    
-    # Add numbered variations for common patterns
+            append(all_initials)
+
+    return bases
+
+
+def generate_upn_combinations(first_name, middle_names, last_name, domain, sort=True):
+    """Generate all possible UPN combinations.
+
+    With sort=False the deduplicated UPNs are returned in generation
+    order, skipping the O(N log N) sort that only matters for display.
+    """
+    # Accumulate domain-free base patterns; the constant @domain suffix is
+    # appended once at the end so dedup and sorting work on shorter keys.
+    bases = _enumerate_bases(first_name, middle_names, last_name)
+    append = bases.append
+
+    # Add numbered variations for common patterns (often used in organizations)
+    first_initial = first_name[0] if first_name else ''
+    last_initial = last_name[0] if last_name else ''
     common_patterns = [
         first_name + last_name if last_name else first_name,
         f"{first_name}.{last_name}" if last_name else first_name,
-        f"{first_name[0]}{last_name}" if last_name else first_name,
-        f"{first_name}{last_name[0]}" if last_name else first_name
+        f"{first_initial}{last_name}" if last_name else first_name,
+        f"{first_name}{last_initial}" if last_name else first_name
     ]
-    
+
     for pattern in common_patterns:
         if pattern:
             for num in range(1, 10):  # Add numbers 1-9
-                upns.add(f"{pattern}{num}@{domain}")
-            
+                append(f"{pattern}{num}")
+
             # Add common suffixes
             for suffix in ['01', '02', '03', '2024', '2025']:
-                upns.add(f"{pattern}{suffix}@{domain}")
-    
-    return sorted(list(upns))
+                append(f"{pattern}{suffix}")
+
+    # Deduplicate once (dict.fromkeys keeps insertion order, so the
+    # unsorted result is still deterministic), then attach the domain suffix
+    upns = [f"{base}@{domain}" for base in dict.fromkeys(bases)]
+    if sort:
+        upns.sort()
+    return upns
 
 
 def main():
@@ -186,20 +225,25 @@ Examples:
             print(f"  Domain: {args.domain}")
             print()
         
-        # Generate UPN combinations
-        upns = generate_upn_combinations(first_name, middle_names, last_name, args.domain)
-        
+        # Generate UPN combinations; sorted order only matters when the
+        # list is dumped to the terminal
+        display = not args.output or args.verbose
+        upns = generate_upn_combinations(first_name, middle_names, last_name,
+                                         args.domain, sort=display)
+
         print(f"Generated {len(upns)} possible UPN combinations:")
-        print("=" * 50)
-        
-        for upn in upns:
-            print(upn)
-        
-        # Save to file if specified
+
+        if display:
+            print("=" * 50)
+            # Single write instead of one print (lock + flush) per UPN
+            sys.stdout.write('\n'.join(upns))
+            sys.stdout.write('\n')
+
+        # Save to file if specified (binary mode: encode each line once and
+        # let the buffered writer batch the syscalls)
         if args.output:
-            with open(args.output, 'w') as f:
-                for upn in upns:
-                    f.write(upn + '\n')
+            with open(args.output, 'wb') as f:
+                f.writelines(upn.encode() + b'\n' for upn in upns)
             print(f"\nUPNs saved to {args.output}")
             
     except ValueError as e:
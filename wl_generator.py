@@ -4,54 +4,76 @@ Penetration Testing User and Password List Generator
 Usage: python pentest_gen.py
 """
 
+# Common password suffixes
+SUFFIXES = ('!', '^', '?', '&', '*', '#', '%', '@')
+
+# Leetspeak substitution tables, one per character so each keyword still
+# yields one variant per substitution (built once, not per call)
+LEET_TABLES = tuple(str.maketrans(char, sub) for char, sub in
+                    (('a', '@'), ('o', '0'), ('e', '3'), ('s', '$'), ('i', '1')))
+
+try:
+    import numpy as np
+except ImportError:  # optional; pure-Python paths are used when absent
+    np = None
+
+# Keyword count above which the NumPy suffix cross-product pays off
+VECTORIZE_THRESHOLD = 512
+
 def generate_usernames(names):
     """Generate username variations from full names"""
-    usernames = set()
-    
+    usernames = {}  # dict keys: same O(1) dedup as a set, insertion-ordered
+
     for name in names:
         name = name.strip()
         if ' ' in name:
             parts = name.split()
             first = parts[0].lower()
             last = parts[-1].lower()
-            
+
             # Generate formats: flast, lfirst, first.last, first, last
-            usernames.add(f"{first[0]}{last}")        # flast
-            usernames.add(f"{last[0]}{first}")        # lfirst  
-            usernames.add(f"{first}.{last}")          # first.last
-            usernames.add(first)                      # first
-            usernames.add(last)                       # last
+            usernames[f"{first[0]}{last}"] = None     # flast
+            usernames[f"{last[0]}{first}"] = None     # lfirst
+            usernames[f"{first}.{last}"] = None       # first.last
+            usernames[first] = None                   # first
+            usernames[last] = None                    # last
         else:
-            usernames.add(name.lower())
+            usernames[name.lower()] = None
     
-    return sorted(list(usernames))
+    return sorted(usernames)
 
 def generate_passwords(keywords):
     """Generate password variations from keywords"""
     passwords = set()
     
-    for keyword in keywords:
-        keyword = keyword.strip()
-        
+    keywords = [keyword.strip() for keyword in keywords]
+    caps = [keyword.capitalize() for keyword in keywords]
+
+    for keyword, cap in zip(keywords, caps):
         # Basic variations
         passwords.add(keyword)                    # original
         passwords.add(keyword.lower())           # lowercase
         passwords.add(keyword.upper())           # uppercase
-        passwords.add(keyword.capitalize())      # capitalize
-        
+        passwords.add(cap)                       # capitalize
+
         # Common substitutions
-        passwords.add(keyword.replace('a', '@'))
-        passwords.add(keyword.replace('o', '0'))
-        passwords.add(keyword.replace('e', '3'))
-        passwords.add(keyword.replace('s', '$'))
-        passwords.add(keyword.replace('i', '1'))
-        
-        # Add common suffixes
-        for suffix in ['!', '^', '?', '&', '*', '#', '%', '@']:
-            passwords.add(keyword + suffix)
-            passwords.add(keyword.capitalize() + suffix)
+        for table in LEET_TABLES:
+            passwords.add(keyword.translate(table))
+
+    # Add common suffixes; for large keyword lists build the full
+    # keyword x suffix cross-product in NumPy instead of looping in Python
+    if np is not None and len(keywords) * len(SUFFIXES) > VECTORIZE_THRESHOLD:
+        kws = np.array(keywords + caps)
+        sufs = np.array(SUFFIXES)
+        passwords.update(np.char.add(kws[:, None], sufs).ravel().tolist())
+    else:
+        for keyword, cap in zip(keywords, caps):
+            # Bulk-insert via set.update: one C-level loop per keyword
+            # instead of one add call per suffix product
+            passwords.update(keyword + suffix for suffix in SUFFIXES)
+            passwords.update(cap + suffix for suffix in SUFFIXES)
     
-    return sorted(list(passwords))
+    return sorted(passwords)
 
 def main():
     print("=== Penetration Testing List Generator ===\n")
@@ -71,9 +93,9 @@ def main():
             for username in usernames:
                 print(f"  {username}")
             
-            # Save to file
+            # Save to file (streamed; avoids building one giant string)
             with open('usernames.txt', 'w') as f:
-                f.write('\n'.join(usernames))
+                f.writelines(username + '\n' for username in usernames)
             print(f"\nSaved to usernames.txt")
         
         print("\n" + "="*50)
@@ -99,17 +121,18 @@ def main():
             file_path = input("Enter file path: ")
             try:
                 with open(file_path, 'a') as f:
-                    f.write('\n' + '\n'.join(passwords))
+                    f.write('\n')
+                    f.writelines(password + '\n' for password in passwords)
                 print(f"Appended {len(passwords)} passwords to {file_path}")
             except Exception as e:
                 print(f"Error appending to file: {e}")
                 print("Creating new file instead...")
                 with open('passwords.txt', 'w') as f:
-                    f.write('\n'.join(passwords))
+                    f.writelines(password + '\n' for password in passwords)
                 print("Saved to passwords.txt")
         else:
             with open('passwords.txt', 'w') as f:
-                f.write('\n'.join(passwords))
+                f.writelines(password + '\n' for password in passwords)
             print("Saved to passwords.txt")
 
 if __name__ == "__main__":